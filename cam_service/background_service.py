@@ -7,11 +7,16 @@ import subprocess
 import cv2   as cv
 import numpy as np
 
+# default limit on how many cameras run the open/configure handshake at once (USB bus contention)
+camera_open_slots = threading.Semaphore(1)
+
 class BackgroundCameraService:
-    def __init__(self, task_id : str, camera_index : int, fpath : str):
-        self.task_id   = task_id
-        self.camera_id = camera_index
-        self.fpath     = fpath
+    def __init__(self, task_id : str, camera_index : int, fpath : str,
+                 open_slots : threading.Semaphore = camera_open_slots):
+        self.task_id    = task_id
+        self.camera_id  = camera_index
+        self.fpath      = fpath
+        self.open_slots = open_slots  # shared between services to serialize hardware init
 
         # setup external thread
         self.thread        = threading.Thread(target = self.run)
@@ -46,10 +51,11 @@ class BackgroundCameraService:
     def exec_capture_frame(self) -> None:
 
         # create camera device
-        self.cam_capture = cv.VideoCapture(self.camera_id)
-        self.cam_capture.set(cv.CAP_PROP_FRAME_WIDTH,  2592) 
-        self.cam_capture.set(cv.CAP_PROP_FRAME_HEIGHT, 1944)  
-        self.cam_capture.set(cv.CAP_PROP_AUTOFOCUS,    1)     # Enable Autofocus
+        with self.open_slots:
+            self.cam_capture = cv.VideoCapture(self.camera_id)
+            self.cam_capture.set(cv.CAP_PROP_FRAME_WIDTH,  2592) 
+            self.cam_capture.set(cv.CAP_PROP_FRAME_HEIGHT, 1944)  
+            self.cam_capture.set(cv.CAP_PROP_AUTOFOCUS,    1)     # Enable Autofocus
 
         # grab initial seed frame
         ret, _  = self.cam_capture.read()
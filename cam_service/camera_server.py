@@ -2,7 +2,6 @@ import os
 import shutil
 import threading
 import time
-import random
 
 # local relative imports
 from scanner            import scan_camera
@@ -47,7 +46,6 @@ if __name__ == "__main__":
     for camera_service in running_services:
         print(f"Starting {camera_service.camera_id} ...")
         camera_service.start()
-        time.sleep(1.5 + random.uniform(-1, 1))
     
     print("All Service Is Running")
 
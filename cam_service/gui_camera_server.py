@@ -1,17 +1,20 @@
+import abc
 import os
 import sys
 import shutil
 import threading
 import time
-import random
 import traceback
 import subprocess
 import signal
-from typing import List, Dict, Optional
+import selectors
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Iterator, List, Dict, Optional, Tuple, Union
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QPushButton, QTextEdit, QVBoxLayout, QHBoxLayout,
+    QApplication, QWidget, QPushButton, QPlainTextEdit, QVBoxLayout, QHBoxLayout,
     QLineEdit, QLabel, QFileDialog, QMessageBox, QComboBox
 )
 
@@ -20,6 +23,18 @@ from scanner            import scan_camera
 from background_service import BackgroundCameraService
 
 
+# Seconds a camera scan stays valid before switching source re-probes (Rescan always does)
+CAMERA_SCAN_TTL = 30.0
+
+
+# Lines kept in the GUI log view
+LOG_MAX_LINES = 5000
+
+
+# Environment for child scripts, built once: force unbuffered UTF-8 output so logs stream live
+CHILD_ENV = {**os.environ, "PYTHONUNBUFFERED": "1", "PYTHONIOENCODING": "utf-8"}
+
+
 # --------- Paths ---------
 def project_root_dir() -> str:
     """One level above cam_service/."""
@@ -49,21 +64,378 @@ def find_jpg_images(devices_dir: str) -> List[str]:
     """Return absolute paths of *.jpg in devices_dir (non-recursive)."""
     if not os.path.isdir(devices_dir):
         return []
-    out = []
-    for name in sorted(os.listdir(devices_dir)):
-        if name.lower().endswith(".jpg"):
-            out.append(os.path.join(devices_dir, name))
+    # scandir gives us d_type for free, so is_file() needs no extra stat()
+    with os.scandir(devices_dir) as it:
+        out = [
+            entry.path for entry in it
+            if entry.name.lower().endswith(".jpg") and entry.is_file(follow_symlinks=False)
+        ]
+    out.sort()
     return out
 
 
+def reset_directory(path: str, max_workers: int = 8) -> None:
+    """
+    Leave `path` as an existing, empty directory.
+    Files (the previous run's frames) are unlinked in parallel from a single scandir pass;
+    an already-empty directory costs one scandir and nothing else.
+    Best effort like rmtree(ignore_errors=True): entries that can't be removed are left behind.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+        return
+    except NotADirectoryError:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        os.makedirs(path, exist_ok=True)
+        return
+    except OSError:
+        # e.g. unreadable but existing dir: leave its contents alone, as rmtree(ignore_errors=True) did
+        os.makedirs(path, exist_ok=True)
+        return
+
+    if not entries:
+        return
+
+    files = [e.path for e in entries if not e.is_dir(follow_symlinks=False)]
+    dirs = [e.path for e in entries if e.is_dir(follow_symlinks=False)]
+
+    def _unlink(p: str):
+        try:
+            os.unlink(p)
+        except OSError:
+            pass  # already gone, read-only, or held open (e.g. by cam_display on Windows)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(_unlink, files))
+    for d in dirs:
+        shutil.rmtree(d, ignore_errors=True)
+
+
+def take_lines(pending: bytearray) -> List[str]:
+    """Remove and decode the complete lines at the front of `pending`; a trailing partial line stays."""
+    end = pending.rfind(b"\n") + 1
+    if not end:
+        return []
+    lines = pending[:end].decode("utf-8", "replace").splitlines()
+    del pending[:end]
+    return lines
+
+
+def iter_output_lines(fd: int, chunk_size: int = 65536) -> Iterator[List[str]]:
+    """
+    Read a child's stdout in large chunks and yield the complete lines of each chunk.
+    A trailing partial line is held back until the rest of it arrives.
+    """
+    pending = bytearray()
+    while True:
+        chunk = os.read(fd, chunk_size)
+        if not chunk:
+            break
+        pending += chunk
+        lines = take_lines(pending)
+        if lines:
+            yield lines
+    if pending:
+        yield pending.decode("utf-8", "replace").splitlines()
+
+
+class ChildOutputSupervisor:
+    """
+    One background thread that drains the stdout of every watched child with a selector,
+    instead of a blocked reader thread per child. The thread starts with the first watch()
+    and exits once nothing is left to watch.
+    POSIX only: selectors can't poll pipes on Windows, where workers read their own pipe.
+    """
+    def __init__(self, chunk_size: int = 65536):
+        self.chunk_size = chunk_size
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, fd: int, on_lines: Callable[[List[str]], None], on_eof: Callable[[], None]):
+        """Feed complete lines from fd to on_lines; call on_eof once the pipe closes."""
+        os.set_blocking(fd, False)
+        with self._lock:
+            self._selector.register(fd, selectors.EVENT_READ, (bytearray(), on_lines, on_eof))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    @staticmethod
+    def _call(callback: Callable, *args):
+        # a failing callback must not take the shared reader thread down with it
+        try:
+            callback(*args)
+        except Exception:
+            traceback.print_exc()
+
+    def _run(self):
+        try:
+            self._drain()
+        finally:
+            # if the loop died anyway, let the next watch() start a fresh thread
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._selector.get_map():
+                    self._thread = None
+                    return
+            for key, _ in self._selector.select(0.1):
+                pending, on_lines, on_eof = key.data
+                try:
+                    chunk = os.read(key.fd, self.chunk_size)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    chunk = b""
+
+                if chunk:
+                    pending += chunk
+                    lines = take_lines(pending)
+                    if lines:
+                        self._call(on_lines, lines)
+                    continue
+
+                with self._lock:
+                    self._selector.unregister(key.fd)
+                if pending:
+                    self._call(on_lines, pending.decode("utf-8", "replace").splitlines())
+                self._call(on_eof)
+
+
+# Shared reader for child stdout (None on Windows, see ChildOutputSupervisor)
+CHILD_OUTPUT: Optional[ChildOutputSupervisor] = ChildOutputSupervisor() if os.name != "nt" else None
+
+
+def signal_process_group(pgid: int, sig: int) -> bool:
+    """Send sig to a process group; False if the group no longer exists."""
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def kill_process_tree(process: subprocess.Popen, timeout: float) -> None:
+    """
+    Stop a child together with anything it spawned (OpenCV/GPU helpers etc.).
+    Windows: taskkill /T. POSIX: the child runs in its own session, so its pid is the group id;
+    the group is signalled even if the child itself already exited, since its helpers may
+    still be running (and holding its stdout open).
+    Falls back to SIGKILL on the whole group if any member is still alive after `timeout` seconds.
+    """
+    if os.name == "nt":
+        if process.poll() is not None:
+            return
+        try:
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except Exception:
+            process.kill()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                process.kill()
+            except Exception:
+                pass
+        return
+
+    pgid = process.pid
+    try:
+        if not signal_process_group(pgid, signal.SIGTERM):
+            return
+    except Exception:
+        process.kill()
+
+    # Escalate on the group, not the child: a helper that ignores SIGTERM keeps the
+    # group (and the child's stdout) alive even after the child itself is gone.
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        process.poll()  # reap the child so its zombie doesn't count as a live member
+        if not signal_process_group(pgid, 0):
+            return
+        time.sleep(0.05)
+
+    try:
+        signal_process_group(pgid, signal.SIGKILL)
+        process.wait(timeout=1)
+    except Exception:
+        pass
+
+
 # --------- Workers ---------
+class LogBuffer:
+    """
+    Lines produced on a worker thread, drained in batches by the GUI thread.
+    Oldest lines are dropped once maxlen is reached so a log storm can't grow it unbounded.
+    on_ready fires once when lines arrive for a reader that hasn't drained them yet,
+    so the Qt event queue holds at most one pending notification per buffer.
+    """
+    def __init__(self, on_ready: Callable[[], None], maxlen: int = 10000):
+        self._lines: Deque[str] = deque(maxlen=maxlen)
+        self._on_ready = on_ready
+        self._notified = False
+
+    def _notify(self):
+        if not self._notified:
+            self._notified = True
+            self._on_ready()
+
+    def append(self, line: str):
+        self._lines.append(line)
+        self._notify()
+
+    def extend(self, lines: List[str]):
+        self._lines.extend(lines)
+        self._notify()
+
+    def drain(self) -> List[str]:
+        # re-arm before popping: anything appended from here on triggers a new notification
+        self._notified = False
+        out = []
+        while True:
+            try:
+                out.append(self._lines.popleft())
+            except IndexError:
+                return out
+
+
+class WorkerSignals(QObject):
+    """Signals for ChildProcessWorker (only QObject subclasses can declare them)."""
+    log_ready = pyqtSignal()
+    finished = pyqtSignal()
+    mode_changed = pyqtSignal(str)
+
+
+class PoolTask(QRunnable):
+    """Runs a callable on a QThreadPool. The owner keeps a reference, so autoDelete is off."""
+    def __init__(self, fn: Callable[[], None]):
+        super().__init__()
+        self.setAutoDelete(False)
+        self._fn = fn
+
+    def run(self):
+        self._fn()
+
+
+_child_spawn_pool: Optional[QThreadPool] = None
+
+
+def child_spawn_pool() -> QThreadPool:
+    """
+    Dedicated pool for the short spawn-and-hand-off step of child workers on POSIX.
+    Kept apart from QThreadPool.globalInstance() so nothing long-lived can starve it.
+    """
+    global _child_spawn_pool
+    if _child_spawn_pool is None:
+        _child_spawn_pool = QThreadPool(QApplication.instance())
+        _child_spawn_pool.setMaxThreadCount(2)  # shelf_scan + cam_display
+    return _child_spawn_pool
+
+
+class ChildProcessWorker(abc.ABC):
+    """
+    Runs a child script and streams its stdout into log_buffer.
+    On POSIX work() only spawns the child and hands its pipe to CHILD_OUTPUT, so it runs on
+    the reused threads of child_spawn_pool(). On Windows work() reads the pipe for the child's
+    whole life, so it gets its own daemon thread, which can never hold up app exit.
+    Exposes the part of the QThread API the GUI uses (start / isRunning / wait and
+    the worker signals) so callers can treat it like the other workers.
+    finished is emitted once work() returns, unless the worker handed its remaining job
+    off (see hand_off_output).
+    """
+    def __init__(self):
+        self.signals = WorkerSignals()
+        self.log_ready = self.signals.log_ready
+        self.finished = self.signals.finished
+        self.mode_changed = self.signals.mode_changed
+        self._process: Optional[subprocess.Popen] = None
+        self.log_buffer = LogBuffer(on_ready=self.log_ready.emit)
+        self._task = PoolTask(self.run)
+        self._started = False
+        self._detached = False
+        self._done = threading.Event()
+
+    def _log(self, msg: str):
+        self.log_buffer.append(msg)
+
+    def start(self):
+        self._started = True
+        if CHILD_OUTPUT is not None:
+            child_spawn_pool().start(self._task)
+        else:
+            threading.Thread(target=self.run, daemon=True).start()
+
+    def isRunning(self) -> bool:
+        return self._started and not self._done.is_set()
+
+    def wait(self, msecs: int) -> bool:
+        if not self._started:
+            return True
+        return self._done.wait(msecs / 1000)
+
+    @abc.abstractmethod
+    def work(self):
+        """Spawn the child; either read its output to the end or hand_off_output()."""
+
+    def run(self):
+        try:
+            self.work()
+        finally:
+            if not self._detached:
+                self._finish()
+
+    def _finish(self):
+        self._done.set()
+        self.finished.emit()
+
+    def hand_off_output(self, exit_label: str):
+        """
+        Let CHILD_OUTPUT read the child's stdout and return the worker thread right away.
+        When the pipe closes the exit code is logged and finished is emitted from there.
+        """
+        process = self._process
+
+        def reap():
+            try:
+                rc = process.wait()
+                self._log(f"{exit_label} exited with code {rc}")
+            finally:
+                self._finish()
+
+        def on_eof():
+            # runs on the shared reader thread: never block it on a child that
+            # closed stdout but is still running
+            if process.poll() is not None:
+                reap()
+            else:
+                threading.Thread(target=reap, daemon=True).start()
+
+        CHILD_OUTPUT.watch(process.stdout.fileno(), self.log_buffer.extend, on_eof)
+        # only once watch() succeeded; if it raised, run() still has to finish normally
+        self._detached = True
+
+
 class CameraServerWorker(QThread):
     """Real camera mode (writes into devices folder, clears it first)."""
     log = pyqtSignal(str)
     finished = pyqtSignal()
     running_changed = pyqtSignal(bool)
 
-    def __init__(self, root_devices_dir: str, camera_indices: List[int]):
+    def __init__(self, root_devices_dir: str, camera_indices: List[int], max_concurrent_opens: int = 1):
         super().__init__()
         # Normalize to .../active_state/devices even if user gives parent
         root_devices_dir = os.path.normpath(root_devices_dir)
@@ -74,6 +446,8 @@ class CameraServerWorker(QThread):
         self._stop_event = threading.Event()
         self.running_services: List[BackgroundCameraService] = []
         self.camera_indices = camera_indices  # explicit list
+        # 1 serializes camera init; raise to 2 on hosts with cameras split over two USB buses
+        self.open_slots = threading.Semaphore(max_concurrent_opens)
 
     def _log(self, msg: str):
         self.log.emit(msg)
@@ -88,8 +462,7 @@ class CameraServerWorker(QThread):
 
             # Clear + recreate directory (same behavior as your script)
             self._log(f"Preparing directory: {self.root_devices_dir}")
-            shutil.rmtree(self.root_devices_dir, ignore_errors=True)
-            os.makedirs(self.root_devices_dir, exist_ok=True)
+            reset_directory(self.root_devices_dir)
 
             # Output similar to the CLI script
             self._log("Searching For Valid Cameras...")
@@ -108,19 +481,19 @@ class CameraServerWorker(QThread):
                 latest_frame_file = os.path.join(
                     self.root_devices_dir, f"camera_{camera_str}_frame.jpg"
                 )
-                svc = BackgroundCameraService(camera_str, camera_id, latest_frame_file)
+                svc = BackgroundCameraService(camera_str, camera_id, latest_frame_file, self.open_slots)
                 self.running_services.append(svc)
 
+            # start() only spawns the capture thread; the camera handshake
+            # itself is throttled inside BackgroundCameraService
             for svc in self.running_services:
                 self._log(f"Starting {svc.camera_id} ...")
                 svc.start()
-                time.sleep(1.0 + random.uniform(-0.5, 0.5))
 
             self._log("All Service Is Running")
 
             # Keep thread alive until stop requested
-            while not self._stop_event.is_set():
-                time.sleep(1)
+            self._stop_event.wait()
 
             # Stop flow
             self._log("Stopping all services...")
@@ -140,7 +513,7 @@ class CameraServerWorker(QThread):
             self._log("All Services are Finished.")
 
         except Exception as e:
-            self._log("FATAL ERROR:\n" + "".join(traceback.format_exception(e)))
+            self._log("FATAL ERROR:\n" + traceback.format_exc())
             QMessageBox.critical(None, "Camera Server Error", str(e))
         finally:
             self.running_changed.emit(False)
@@ -181,26 +554,21 @@ class ImageSourceWorker(QThread):
                     self._log(f" - {os.path.basename(p)}")
 
             # Keep alive without touching files
-            while not self._stop_event.is_set():
-                time.sleep(1)
+            self._stop_event.wait()
 
             self._log("Image source stopped.")
-        except Exception as e:
-            self._log("FATAL ERROR:\n" + "".join(traceback.format_exception(e)))
+        except Exception:
+            self._log("FATAL ERROR:\n" + traceback.format_exc())
         finally:
             self.running_changed.emit(False)
             self.finished.emit()
 
 
-class ShelfScanWorker(QThread):
+class ShelfScanWorker(ChildProcessWorker):
     """
     Runs: <venv_python> -u <project_root>/product_scan/shelf_scan.py [setup|service]
     Streams stdout->GUI live. 'setup' ends by itself; 'service' runs until stop() is called.
     """
-    log = pyqtSignal(str)
-    finished = pyqtSignal()
-    mode_changed = pyqtSignal(str)
-
     def __init__(self, project_root: str, mode: str, python_exe: Optional[str] = None):
         super().__init__()
         assert mode in ("setup", "service")
@@ -208,27 +576,21 @@ class ShelfScanWorker(QThread):
         self.mode = mode
         self.python_exe = python_exe or sys.executable  # ensure we use the venv that launched the GUI
         self._stop = False
-        self._process: Optional[subprocess.Popen] = None
         self.shelf_scan_path = os.path.join(project_root, "product_scan", "shelf_scan.py")
 
-    def run(self):
+    def work(self):
         try:
             if not os.path.isfile(self.shelf_scan_path):
-                self.log.emit(f"Not found: {self.shelf_scan_path}")
+                self._log(f"Not found: {self.shelf_scan_path}")
                 return
 
-            # Force unbuffered output from the child process
-            env = os.environ.copy()
-            env["PYTHONUNBUFFERED"] = "1"
-            env["PYTHONIOENCODING"] = "utf-8"
-
             cmd = [self.python_exe, "-u", self.shelf_scan_path, self.mode]
             creationflags = 0
             if os.name == "nt":
                 creationflags = subprocess.CREATE_NEW_PROCESS_GROUP
 
-            self.log.emit(f"Executing with interpreter: {self.python_exe}")
-            self.log.emit(f"Command: {' '.join(cmd)}")
+            self._log(f"Executing with interpreter: {self.python_exe}")
+            self._log(f"Command: {' '.join(cmd)}")
             self.mode_changed.emit(self.mode)
 
             self._process = subprocess.Popen(
@@ -236,81 +598,56 @@ class ShelfScanWorker(QThread):
                 cwd=self.project_root,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,                 # line-buffered on our side
+                bufsize=0,                 # raw pipe; we read big chunks ourselves
                 creationflags=creationflags,
-                env=env
+                start_new_session=(os.name != "nt"),  # own process group, see kill_process_tree()
+                env=CHILD_ENV
             )
             assert self._process.stdout is not None
 
             # Immediate activity line
-            self.log.emit(f"shelf_scan.py ({self.mode}) started (pid={self._process.pid})")
+            self._log(f"shelf_scan.py ({self.mode}) started (pid={self._process.pid})")
+
+            if CHILD_OUTPUT is not None:
+                self.hand_off_output(f"shelf_scan.py ({self.mode})")
+                return
 
-            # Read lines as they arrive
-            for line in iter(self._process.stdout.readline, ''):
+            # Read output as it arrives
+            for lines in iter_output_lines(self._process.stdout.fileno()):
                 if self._stop and self.mode == "service":
                     break
-                if not line:
-                    break
-                self.log.emit(line.rstrip())
+                self.log_buffer.extend(lines)
 
             rc = self._process.wait()
-            self.log.emit(f"shelf_scan.py ({self.mode}) exited with code {rc}")
+            self._log(f"shelf_scan.py ({self.mode}) exited with code {rc}")
         except Exception as e:
-            self.log.emit(f"Error running shelf_scan.py ({self.mode}): {e}")
-        finally:
-            self.finished.emit()
+            self._log(f"Error running shelf_scan.py ({self.mode}): {e}")
 
     def stop(self):
         self._stop = True
-        if self._process and self._process.poll() is None:
-            try:
-                if os.name == "nt":
-                    self._process.send_signal(signal.CTRL_BREAK_EVENT)
-                    try:
-                        self._process.wait(timeout=3)
-                    except Exception:
-                        self._process.terminate()
-                else:
-                    self._process.terminate()
-                try:
-                    self._process.wait(timeout=3)
-                except Exception:
-                    self._process.kill()
-            except Exception:
-                try:
-                    self._process.kill()
-                except Exception:
-                    pass
+        if self._process:
+            kill_process_tree(self._process, timeout=3)
 
 
-class CamDisplayWorker(QThread):
+class CamDisplayWorker(ChildProcessWorker):
     """
     Runs: <venv_python> -u <project_root>/cam_display/display_camera.py --root-dir <path> --title <title>
     Streams stdout->GUI live. Stops when window is closed or 'q' in that window; you can also stop from GUI.
     """
-    log = pyqtSignal(str)
-    finished = pyqtSignal()
-
     def __init__(self, project_root: str, root_dir: str, title: str, python_exe: Optional[str] = None):
         super().__init__()
         self.project_root = project_root
         self.root_dir = root_dir
         self.title = title
         self.python_exe = python_exe or sys.executable
-        self._process: Optional[subprocess.Popen] = None
 
-    def run(self):
+    def work(self):
         try:
             display_path = os.path.join(self.project_root, "cam_display", "display_camera.py")
             if not os.path.isfile(display_path):
-                self.log.emit(f"Not found: {display_path}")
+                self._log(f"Not found: {display_path}")
                 return
 
-            env = os.environ.copy()
-            env["PYTHONUNBUFFERED"] = "1"
-            env["PYTHONIOENCODING"] = "utf-8"
-
             cmd = [
                 self.python_exe, "-u", display_path,
                 "--root-dir", self.root_dir,
@@ -320,52 +657,35 @@ class CamDisplayWorker(QThread):
             if os.name == "nt":
                 creationflags = subprocess.CREATE_NEW_PROCESS_GROUP
 
-            self.log.emit(f"Executing cam display: {' '.join(cmd)}")
+            self._log(f"Executing cam display: {' '.join(cmd)}")
             self._process = subprocess.Popen(
                 cmd,
                 cwd=self.project_root,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                bufsize=0,
                 creationflags=creationflags,
-                env=env
+                start_new_session=(os.name != "nt"),  # own process group, see kill_process_tree()
+                env=CHILD_ENV
             )
             assert self._process.stdout is not None
 
-            self.log.emit(f"cam_display started (pid={self._process.pid})")
-            for line in iter(self._process.stdout.readline, ''):
-                if not line:
-                    break
-                self.log.emit(line.rstrip())
+            self._log(f"cam_display started (pid={self._process.pid})")
+            if CHILD_OUTPUT is not None:
+                self.hand_off_output("cam_display")
+                return
+
+            for lines in iter_output_lines(self._process.stdout.fileno()):
+                self.log_buffer.extend(lines)
 
             rc = self._process.wait()
-            self.log.emit(f"cam_display exited with code {rc}")
+            self._log(f"cam_display exited with code {rc}")
         except Exception as e:
-            self.log.emit(f"Error running cam_display: {e}")
-        finally:
-            self.finished.emit()
+            self._log(f"Error running cam_display: {e}")
 
     def stop(self):
-        if self._process and self._process.poll() is None:
-            try:
-                if os.name == "nt":
-                    self._process.send_signal(signal.CTRL_BREAK_EVENT)
-                    try:
-                        self._process.wait(timeout=2)
-                    except Exception:
-                        self._process.terminate()
-                else:
-                    self._process.terminate()
-                try:
-                    self._process.wait(timeout=2)
-                except Exception:
-                    self._process.kill()
-            except Exception:
-                try:
-                    self._process.kill()
-                except Exception:
-                    pass
+        if self._process:
+            kill_process_tree(self._process, timeout=2)
 
 
 # --------- GUI ---------
@@ -376,6 +696,8 @@ class MainWindow(QWidget):
 
         # === Path row ===
         self.path_edit = QLineEdit(default_root_devices_dir())
+        self.path_edit.textChanged.connect(self.on_path_changed)
+        self.on_path_changed(self.path_edit.text())
         browse_btn = QPushButton("Browse…")
         browse_btn.clicked.connect(self.browse_for_path)
 
@@ -393,7 +715,7 @@ class MainWindow(QWidget):
         # item selector row (images or cameras depending on source)
         self.item_combo = QComboBox()
         self.rescan_btn = QPushButton("Rescan")
-        self.rescan_btn.clicked.connect(self.rescan_items)
+        self.rescan_btn.clicked.connect(lambda: self.request_rescan(force=True))
 
         source_row = QHBoxLayout()
         source_row.addWidget(QLabel("Input Source:"))
@@ -438,8 +760,9 @@ class MainWindow(QWidget):
         display_row.addWidget(self.display_stop_btn)
 
         # === Log view ===
-        self.log_view = QTextEdit()
+        self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(LOG_MAX_LINES)  # Qt drops the oldest lines
 
         # === Layout ===
         layout = QVBoxLayout()
@@ -461,17 +784,26 @@ class MainWindow(QWidget):
         self.display_stop_btn.clicked.connect(self.stop_cam_display)
 
         # Worker holders
-        self.active_worker: Optional[QThread] = None  # CameraServerWorker or ImageSourceWorker
+        self.active_worker: Optional[Union[CameraServerWorker, ImageSourceWorker]] = None
         self.shelf_worker: Optional[ShelfScanWorker] = None
         self.display_worker: Optional[CamDisplayWorker] = None
 
         # State caches
         self.detected_cameras: List[int] = []
-        self.detected_images: List[str] = []  # absolute paths
-        self.image_name_to_path: Dict[str, str] = {}
+        self.detected_images_pairs: List[Tuple[str, str]] = []  # (file name, absolute path), sorted by name
+        # devices_dir -> (st_mtime_ns, detected_images_pairs)
+        self._jpg_cache: Dict[str, Tuple[int, List[Tuple[str, str]]]] = {}
+        # (monotonic time of scan, camera indices)
+        self._camera_scan_cache: Optional[Tuple[float, List[int]]] = None
+
+        # Coalesce bursts of rescan requests (Browse, source flips, repeated Rescan clicks)
+        self._rescan_force = False
+        self._rescan_timer = QTimer(self)
+        self._rescan_timer.setSingleShot(True)
+        self._rescan_timer.setInterval(200)
+        self._rescan_timer.timeout.connect(self._do_rescan)
 
         # Initial fill
-        self.on_source_changed()
         self.rescan_items(initial=True)
 
     # ----- UI helpers -----
@@ -481,24 +813,32 @@ class MainWindow(QWidget):
         if path:
             self.path_edit.setText(path)
             # refresh items for current source after path change
-            self.rescan_items()
+            self.request_rescan()
 
     def on_source_changed(self):
         # Rebuild item combo label & content
-        self.rescan_items()
+        self.request_rescan()
+
+    def request_rescan(self, force: bool = False):
+        """Schedule rescan_items(); calls within 200ms of each other collapse into one scan."""
+        self._rescan_force = self._rescan_force or force
+        self._rescan_timer.start()
 
-    def rescan_items(self, initial: bool = False):
+    def _do_rescan(self):
+        force, self._rescan_force = self._rescan_force, False
+        self.rescan_items(force=force)
+
+    def rescan_items(self, initial: bool = False, force: bool = False):
         source = self.source_combo.currentData()
         devices_dir = self.get_devices_dir_normalized()
 
         if source == "images":
-            # List images from devices folder
-            self.detected_images = find_jpg_images(devices_dir)
-            self.image_name_to_path = {os.path.basename(p): p for p in self.detected_images}
+            # List images from devices folder (reuse last listing if the folder is unchanged)
+            self.detected_images_pairs = self.list_images(devices_dir, force=force)
             current = self.item_combo.currentData()
             self.item_combo.clear()
             self.item_combo.addItem("All images", userData="ALL_IMG")
-            for name in sorted(self.image_name_to_path.keys()):
+            for name, _ in self.detected_images_pairs:
                 self.item_combo.addItem(name, userData=name)
 
             if current is not None:
@@ -510,13 +850,13 @@ class MainWindow(QWidget):
                             break
                 self.item_combo.setCurrentIndex(index_to_set)
 
-            if not self.detected_images:
+            if not self.detected_images_pairs:
                 self.append_log(f"[Images] No .jpg files found in: {devices_dir}")
             else:
-                self.append_log(f"[Images] Found {len(self.detected_images)} image(s) in: {devices_dir}")
+                self.append_log(f"[Images] Found {len(self.detected_images_pairs)} image(s) in: {devices_dir}")
 
         else:  # cameras
-            cams = scan_camera(100)
+            cams = self.list_cameras(force=force)
             self.detected_cameras = cams
             current = self.item_combo.currentData()
             self.item_combo.clear()
@@ -540,21 +880,52 @@ class MainWindow(QWidget):
 
         if initial and source == "cameras" and not self.detected_cameras:
             QMessageBox.information(self, "Scan", "No cameras detected on first scan.")
-        if initial and source == "images" and not self.detected_images:
+        if initial and source == "images" and not self.detected_images_pairs:
             QMessageBox.information(self, "Scan", f"No .jpg images in:\n{devices_dir}")
 
-    def get_devices_dir_normalized(self) -> str:
-        root_path = self.path_edit.text().strip()
-        root_path = os.path.normpath(root_path)
+    def list_images(self, devices_dir: str, force: bool = False) -> List[Tuple[str, str]]:
+        """Return sorted (name, path) pairs for devices_dir, cached on the folder's mtime."""
+        try:
+            mtime = os.stat(devices_dir).st_mtime_ns
+        except OSError:
+            self._jpg_cache.pop(devices_dir, None)
+            return []
+
+        cached = self._jpg_cache.get(devices_dir)
+        if not force and cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # paths share the devices_dir prefix, so path order is already name order
+        pairs = [(os.path.basename(p), p) for p in find_jpg_images(devices_dir)]
+        self._jpg_cache[devices_dir] = (mtime, pairs)
+        return pairs
+
+    def list_cameras(self, force: bool = False) -> List[int]:
+        """Probe cameras with scan_camera(100), reusing the last result for CAMERA_SCAN_TTL seconds."""
+        now = time.monotonic()
+        cached = self._camera_scan_cache
+        if not force and cached is not None and now - cached[0] < CAMERA_SCAN_TTL:
+            return cached[1]
+
+        cams = scan_camera(100)
+        self._camera_scan_cache = (now, cams)
+        return cams
+
+    def on_path_changed(self, text: str):
+        """Normalize the root path once per edit; the getters below just return the result."""
+        root_path = os.path.normpath(text.strip())
         # accept either .../active_state or .../active_state/devices and normalize to /devices
         if os.path.basename(root_path).lower() != "devices":
             root_path = os.path.join(root_path, "devices")
-        return root_path
+        self._devices_dir_cache = root_path
+        self._active_state_cache = os.path.dirname(root_path)
+
+    def get_devices_dir_normalized(self) -> str:
+        return self._devices_dir_cache
 
     def get_active_state_dir(self) -> str:
         """Return .../active_state given devices dir normalization."""
-        devices_dir = self.get_devices_dir_normalized()
-        return os.path.dirname(devices_dir)
+        return self._active_state_cache
 
     # ----- Start/Stop for source -----
     def start_source(self):
@@ -569,13 +940,13 @@ class MainWindow(QWidget):
             # Use existing images; DO NOT modify devices folder
             sel = self.item_combo.currentData()
             if sel == "ALL_IMG":
-                selected_list = list(self.detected_images)
+                selected_list = [path for _, path in self.detected_images_pairs]
                 if not selected_list:
                     QMessageBox.warning(self, "No Images", "No images found. Try 'Rescan'.")
                     return
             else:
                 # User selected a specific filename
-                path = self.image_name_to_path.get(str(sel))
+                path = next((p for name, p in self.detected_images_pairs if name == sel), None)
                 if not path:
                     QMessageBox.warning(self, "Selection", "Selected image not found.")
                     return
@@ -602,7 +973,7 @@ class MainWindow(QWidget):
             self.append_log(f"=== Starting Camera Server (cameras={camera_list}) ===")
             worker.start()
 
-    def wire_source_worker(self, worker: QThread, label: str):
+    def wire_source_worker(self, worker: Union[CameraServerWorker, ImageSourceWorker], label: str):
         self.active_worker = worker  # CameraServerWorker or ImageSourceWorker
         if hasattr(worker, "log"):
             worker.log.connect(self.append_log)
@@ -628,8 +999,8 @@ class MainWindow(QWidget):
         proj_root = project_root_dir()
         self.append_log("=== Starting shelf_scan.py setup ===")
         self.shelf_worker = ShelfScanWorker(proj_root, mode="setup", python_exe=sys.executable)
-        self.shelf_worker.log.connect(self.append_log)
-        self.shelf_worker.finished.connect(lambda: self.append_log("=== Shelf setup finished ==="))
+        self.shelf_worker.log_ready.connect(self.flush_worker_logs)
+        self.shelf_worker.finished.connect(self.on_shelf_setup_finished)
         self.shelf_worker.start()
 
     def start_shelf_service(self):
@@ -640,7 +1011,7 @@ class MainWindow(QWidget):
         proj_root = project_root_dir()
         self.append_log("=== Starting shelf_scan.py service ===")
         self.shelf_worker = ShelfScanWorker(proj_root, mode="service", python_exe=sys.executable)
-        self.shelf_worker.log.connect(self.append_log)
+        self.shelf_worker.log_ready.connect(self.flush_worker_logs)
         self.shelf_worker.finished.connect(self.on_shelf_service_finished)
         self.toggle_shelf_service_buttons(running=True)
         self.shelf_worker.start()
@@ -678,7 +1049,7 @@ class MainWindow(QWidget):
             title=title,
             python_exe=sys.executable
         )
-        self.display_worker.log.connect(self.append_log)
+        self.display_worker.log_ready.connect(self.flush_worker_logs)
         self.display_worker.finished.connect(self.on_display_finished)
         self.toggle_display_buttons(running=True)
         self.display_worker.start()
@@ -698,11 +1069,17 @@ class MainWindow(QWidget):
     def on_source_running_changed(self, running: bool):
         pass
 
+    def on_shelf_setup_finished(self):
+        self.flush_worker_logs()
+        self.append_log("=== Shelf setup finished ===")
+
     def on_shelf_service_finished(self):
+        self.flush_worker_logs()
         self.append_log("=== Shelf service finished ===")
         self.toggle_shelf_service_buttons(running=False)
 
     def on_display_finished(self):
+        self.flush_worker_logs()
         self.append_log("=== Cam display finished ===")
         self.toggle_display_buttons(running=False)
 
@@ -721,34 +1098,32 @@ class MainWindow(QWidget):
 
     # ----- Misc -----
     def append_log(self, text: str):
-        self.log_view.append(text)
+        # appendPlainText follows the tail only when the view is already at the bottom
+        self.log_view.appendPlainText(text)
+
+    def flush_worker_logs(self):
+        """Append everything the subprocess workers buffered since the last flush, one append per worker."""
+        for worker in (self.shelf_worker, self.display_worker):
+            if worker is None:
+                continue
+            batch = worker.log_buffer.drain()
+            if batch:
+                self.append_log("\n".join(batch))
 
     def closeEvent(self, event):
         # Graceful shutdown on window close
         if self.active_worker and self.active_worker.isRunning():
             if hasattr(self.active_worker, "request_stop"):
                 self.active_worker.request_stop()
-            for _ in range(20):
-                if not self.active_worker.isRunning():
-                    break
-                QApplication.processEvents()
-                time.sleep(0.05)
+            self.active_worker.wait(1000)
 
         if self.shelf_worker and self.shelf_worker.isRunning():
             self.shelf_worker.stop()
-            for _ in range(60):
-                if not self.shelf_worker.isRunning():
-                    break
-                QApplication.processEvents()
-                time.sleep(0.05)
+            self.shelf_worker.wait(3000)
 
         if self.display_worker and self.display_worker.isRunning():
             self.display_worker.stop()
-            for _ in range(20):
-                if not self.display_worker.isRunning():
-                    break
-                QApplication.processEvents()
-                time.sleep(0.05)
+            self.display_worker.wait(1000)
 
         event.accept()
 